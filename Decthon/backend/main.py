@@ -4,23 +4,77 @@ Provides streaming chat responses for movie recommendations.
 """
 
 import os
-import json
+import sys
+import time
+import logging
+import asyncio
+import functools
+import anyio
 import httpx
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-from typing import Optional, List
-from openai import OpenAI
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from sse_starlette.sse import EventSourceResponse
+from cachetools import TTLCache
+from prometheus_client import CollectorRegistry, Counter, Histogram, make_asgi_app, multiprocess
+from typing import Optional, List, Dict, Tuple, AsyncIterator
+from contextlib import asynccontextmanager
+from openai import AsyncOpenAI, APIError
 from dotenv import load_dotenv
 
+# `python main.py` runs this file as __main__ (__mp_main__ in spawned workers)
+# before uvicorn imports "main:app"; register it as "main" so the app, clients
+# and metrics are only built once per process
+if __name__ in ("__main__", "__mp_main__"):
+    sys.modules.setdefault("main", sys.modules[__name__])
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger("cineverse")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the pooled TMDB HTTP client, start the genre map refresher and warm
+    connections; on shutdown stop the tasks and close the HTTP clients.
+    """
+    global TMDB_HTTP
+    TMDB_HTTP = httpx.AsyncClient(
+        base_url=TMDB_BASE_URL,
+        http2=True,
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+        timeout=10.0
+    )
+    tasks = []
+    if TMDB_API_KEY:
+        try:
+            await load_genre_map()
+        except (httpx.HTTPError, ValueError, KeyError):
+            # search_movie falls back to the details endpoint until a refresh succeeds
+            pass
+        tasks.append(asyncio.create_task(refresh_genre_map()))
+    # Runs in the background so a slow upstream doesn't hold up startup
+    tasks.append(asyncio.create_task(warm_connections(completion=True)))
+    
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let them unwind before their HTTP clients are closed underneath them
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await TMDB_HTTP.aclose()
+        await client.close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Cineverse API",
-    description="Movie recommendation chatbot powered by GPT-4o"
+    description="Movie recommendation chatbot powered by GPT-4o",
+    lifespan=lifespan
 )
 
 # CORS middleware for frontend access
@@ -32,15 +86,74 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Prometheus metrics endpoint. With several workers each process has its own
+# registry, so PROMETHEUS_MULTIPROC_DIR switches to aggregating all of them.
+if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    _metrics_registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(_metrics_registry)
+    app.mount("/metrics", make_asgi_app(registry=_metrics_registry))
+else:
+    app.mount("/metrics", make_asgi_app())
+
+# Time from OpenAI request to first content delta (prefill latency)
+TTFT_SECONDS = Histogram(
+    "cineverse_ttft_seconds",
+    "Time to first streamed token from GPT-4o",
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5)
+)
+
+# Prompt tokens sent to GPT-4o and how many were served from OpenAI's prefix cache
+PROMPT_TOKENS = Counter("cineverse_prompt_tokens", "Prompt tokens sent to GPT-4o")
+CACHED_PROMPT_TOKENS = Counter(
+    "cineverse_cached_prompt_tokens",
+    "Prompt tokens served from OpenAI's prompt cache"
+)
+
+# Initialize OpenAI client with a larger connection pool than the SDK default
+client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    http_client=httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=1000, max_keepalive_connections=200),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+)
 
 # TMDB API configuration
 TMDB_API_KEY = os.getenv("TMDB_API_KEY")
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
+OVERVIEW_MAX_CHARS = 240  # Movie cards only show a short blurb
+MAX_BATCH_MOVIES = 20  # Titles accepted per /search-movies call
+
+# Shared TMDB HTTP client (created on startup so connections are reused)
+TMDB_HTTP: Optional[httpx.AsyncClient] = None
+
+# TMDB genre id -> name table (loaded on startup, refreshed daily; saves a /movie/{id} call)
+GENRE_MAP: Dict[int, str] = {}
+GENRE_REFRESH_SECONDS = 86_400
+GENRE_RETRY_SECONDS = 60
+
+# TMDB lookup cache keyed by (title, year); metadata is stable within a day
+MOVIE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=86_400)
+# Lookups currently in flight, so identical concurrent requests share one fetch
+_inflight: Dict[Tuple[str, Optional[int]], asyncio.Task] = {}
+
+# Pre-encoded SSE framing (EventSourceResponse sends bytes as-is)
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+_SSE_INTERNAL_ERROR = b'data: {"error":"Internal error while generating response"}\n\n'
+_SSE_TTFT_PREFIX = b"event: ttft\ndata: "
 
-# System prompt for movie recommendations
+# Delta coalescing: flush buffered text at this many chars or after this many seconds
+_FLUSH_CHARS = 256
+_FLUSH_INTERVAL = 0.02
+_SENTENCE_END = (".", "!", "?", "\n")
+
+# System prompt for movie recommendations.
+# Kept static and sent first so OpenAI's automatic prefix caching can reuse it
+# across requests; never template per-user or per-request data into it.
 MOVIE_SYSTEM_PROMPT = """You are CineBot, an expert movie recommendation assistant for Cineverse.
 
 Your expertise includes:
@@ -73,45 +186,209 @@ politely redirect to movie-related discussions.
 
 Remember: You're helping users find their next favorite film! 🎬"""
 
+# Longest user message accepted by /chat (long prompts inflate prefill time and cost)
+MAX_PROMPT_CHARS = 4096
+
+# Prebuilt system messages; each request only appends its user message
+_MSGS_REC = ({"role": "system", "content": MOVIE_SYSTEM_PROMPT},)
+_MSGS_PLAIN = ({"role": "system", "content": "You are a helpful assistant."},)
+
+
+async def warm_connections(completion: bool = False) -> Dict[str, bool]:
+    """
+    Open OpenAI and TMDB connections (DNS, TLS, pool) ahead of real requests.
+    OpenAI is warmed with a free model lookup unless completion is set, in which
+    case a billed max_tokens=1 gpt-4o completion also warms the model path.
+    Returns which upstreams responded.
+    """
+    calls = {}
+    if os.getenv("OPENAI_API_KEY"):
+        if completion:
+            calls["openai"] = client.chat.completions.create(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "hi"}],
+                max_tokens=1
+            )
+        else:
+            calls["openai"] = client.models.retrieve("gpt-4o")
+    if TMDB_API_KEY:
+        calls["tmdb"] = TMDB_HTTP.get("/configuration", params={"api_key": TMDB_API_KEY})
+    
+    results = await asyncio.gather(*calls.values(), return_exceptions=True)
+    return {name: not isinstance(result, Exception) for name, result in zip(calls, results)}
+
+
+async def load_genre_map():
+    """Fetch TMDB's movie genre list into GENRE_MAP"""
+    response = await TMDB_HTTP.get(
+        "/genre/movie/list",
+        params={"api_key": TMDB_API_KEY}
+    )
+    response.raise_for_status()
+    genres = {genre["id"]: genre["name"] for genre in response.json()["genres"]}
+    GENRE_MAP.clear()
+    GENRE_MAP.update(genres)
+
+
+async def refresh_genre_map():
+    """Reload GENRE_MAP daily, retrying sooner while it is empty"""
+    while True:
+        await asyncio.sleep(GENRE_REFRESH_SECONDS if GENRE_MAP else GENRE_RETRY_SECONDS)
+        try:
+            await load_genre_map()
+        except (httpx.HTTPError, ValueError, KeyError):
+            pass
+
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint"""
+    # No str_max_length: an oversized message must reach chat() for a 413, since a
+    # validation 422 would echo the whole prompt back in its body
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+    
     message: str
     stream: bool = True
     is_recommendation: bool = True
 
 
-async def generate_stream(message: str, is_recommendation: bool):
+def record_prompt_cache(usage):
+    """Count how much of the prompt was served from OpenAI's prefix cache"""
+    details = usage.prompt_tokens_details
+    cached = details.cached_tokens if details is not None else 0
+    PROMPT_TOKENS.inc(usage.prompt_tokens)
+    CACHED_PROMPT_TOKENS.inc(cached or 0)
+
+
+async def generate_stream(
+    message: str, is_recommendation: bool, http_request: Request
+) -> AsyncIterator[bytes]:
     """Generate streaming response from OpenAI GPT-4o"""
+    # Text received but not yet sent; flushed ahead of any error frame
+    pending: List[str] = []
     try:
-        system_prompt = MOVIE_SYSTEM_PROMPT if is_recommendation else "You are a helpful assistant."
+        messages = [*(_MSGS_REC if is_recommendation else _MSGS_PLAIN), {"role": "user", "content": message}]
         
-        stream = client.chat.completions.create(
+        t0 = time.perf_counter()
+        ttft = None
+        stream = await client.chat.completions.create(
             model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": message}
-            ],
+            messages=messages,
             stream=True,
             max_tokens=1000,
-            temperature=0.7
+            temperature=0.7,
+            # Final chunk carries usage, including how many prompt tokens hit the cache
+            stream_options={"include_usage": True}
         )
         
-        for chunk in stream:
-            if chunk.choices[0].delta.content:
-                text = chunk.choices[0].delta.content
-                data = json.dumps({"text": text})
-                yield f"data: {data}\n\n"
+        # Local aliases for names used on every token
+        encode = orjson.dumps
+        prefix = _SSE_PREFIX
+        suffix = _SSE_SUFFIX
+        clock = asyncio.get_running_loop().time
+        
+        # Frame buffer reused across flushes instead of concatenating new bytes objects
+        buf = bytearray()
+        append = pending.append
+        pending_len = 0
+        last_flush = clock()
+        # Send every token until the first sentence ends, then start batching
+        batching = False
+        
+        def take_frame() -> bytes:
+            """Frame the buffered text as one SSE event and clear the buffer"""
+            nonlocal pending_len
+            buf.clear()
+            buf.extend(prefix)
+            buf.extend(encode({"text": "".join(pending)}))
+            buf.extend(suffix)
+            pending.clear()
+            pending_len = 0
+            # sse-starlette only passes bytes through untouched, not bytearray
+            return bytes(buf)
         
-        yield "data: [DONE]\n\n"
+        chunks = stream.__aiter__()
+        # Pending read kept across flush deadlines so a timeout never drops a chunk
+        next_chunk: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if pending:
+                    # Buffered text must not wait on a stalled upstream past the deadline
+                    if next_chunk is None:
+                        next_chunk = asyncio.ensure_future(chunks.__anext__())
+                    timeout = max(last_flush + _FLUSH_INTERVAL - clock(), 0)
+                    done, _ = await asyncio.wait((next_chunk,), timeout=timeout)
+                    if not done:
+                        if await http_request.is_disconnected():
+                            return
+                        yield take_frame()
+                        last_flush = clock()
+                        continue
+                
+                try:
+                    chunk = await (next_chunk if next_chunk is not None else chunks.__anext__())
+                except StopAsyncIteration:
+                    break
+                next_chunk = None
+                
+                choices = chunk.choices
+                if not choices:
+                    if chunk.usage is not None:
+                        record_prompt_cache(chunk.usage)
+                    continue
+                text = choices[0].delta.content
+                if not text:
+                    continue
+                append(text)
+                pending_len += len(text)
+                
+                first_token = ttft is None
+                if first_token:
+                    # Measured on arrival of the first meaningful content (not the
+                    # role-only opening chunk), before any downstream send time
+                    ttft = time.perf_counter() - t0
+                    TTFT_SECONDS.observe(ttft)
+                
+                now = clock()
+                if not batching or pending_len >= _FLUSH_CHARS or now - last_flush >= _FLUSH_INTERVAL:
+                    if await http_request.is_disconnected():
+                        # Client is gone, stop paying for tokens nobody will read
+                        return
+                    yield take_frame()
+                    last_flush = now
+                    batching = batching or text.rstrip(" ").endswith(_SENTENCE_END)
+                
+                if first_token:
+                    yield _SSE_TTFT_PREFIX + encode({"ttft_ms": round(ttft * 1000, 1)}) + suffix
         
-    except Exception as e:
-        error_data = json.dumps({"error": str(e)})
-        yield f"data: {error_data}\n\n"
+            if pending:
+                yield take_frame()
+            
+            yield _SSE_DONE
+        finally:
+            if next_chunk is not None:
+                next_chunk.cancel()
+            # Closes the upstream HTTP response, which aborts generation early. Shielded
+            # because on disconnect sse-starlette cancels us through an anyio scope,
+            # which would cancel this await too.
+            with anyio.CancelScope(shield=True):
+                await stream.close()
+        
+    except asyncio.CancelledError:
+        # Client disconnected; don't write an error frame to a dead socket
+        raise
+    except APIError as e:
+        if pending:
+            yield _SSE_PREFIX + orjson.dumps({"text": "".join(pending)}) + _SSE_SUFFIX
+        yield _SSE_PREFIX + orjson.dumps({"error": str(e)}) + _SSE_SUFFIX
+    except Exception:
+        logger.exception("Unexpected error while streaming chat response")
+        # Headers are already sent, so tell the client before the stream is cut
+        yield _SSE_INTERNAL_ERROR
+        raise
 
 
 @app.post("/chat")
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, http_request: Request):
     """
     Chat endpoint that streams responses from GPT-4o.
     
@@ -126,32 +403,57 @@ async def chat(request: ChatRequest):
     if not request.message.strip():
         raise HTTPException(status_code=400, detail="Message cannot be empty")
     
-    return StreamingResponse(
-        generate_stream(request.message, request.is_recommendation),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
+    if len(request.message) > MAX_PROMPT_CHARS:
+        raise HTTPException(status_code=413, detail="Prompt too long")
+    
+    # Sets the no-cache/no-buffering headers and sends keepalive pings for idle proxies
+    return EventSourceResponse(
+        generate_stream(request.message, request.is_recommendation, http_request),
+        ping=15
     )
 
 
+class HealthStatus(BaseModel):
+    """Response model for health endpoint"""
+    status: str
+    service: str
+    model: str
+    tmdb_configured: bool
+
+
+class WarmupStatus(BaseModel):
+    """Response model for warmup endpoint"""
+    warmed: Dict[str, bool]
+
+
+# Typed return values let FastAPI serialize straight to JSON bytes via Pydantic
 @app.get("/health")
-async def health_check():
+async def health_check() -> HealthStatus:
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "Cineverse API",
-        "model": "gpt-4o",
-        "tmdb_configured": bool(TMDB_API_KEY)
-    }
+    return HealthStatus(
+        status="healthy",
+        service="Cineverse API",
+        model="gpt-4o",
+        tmdb_configured=bool(TMDB_API_KEY)
+    )
+
+
+@app.get("/warmup")
+async def warmup(completion: bool = False) -> WarmupStatus:
+    """
+    Pre-open upstream connections, e.g. from a readiness probe.
+    Pass ?completion=true to also run a (billed) one-token gpt-4o completion.
+    """
+    return WarmupStatus(warmed=await warm_connections(completion))
 
 
 class MovieSearchRequest(BaseModel):
     """Request model for movie search endpoint"""
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, str_max_length=8192)
+    
     title: str
     year: Optional[int] = None
+    movie_id: Optional[int] = None  # Optional TMDB id hint, lets a details fallback load alongside search
 
 
 class MovieData(BaseModel):
@@ -165,76 +467,162 @@ class MovieData(BaseModel):
     genres: List[str]
 
 
+# Serializes MovieData straight to JSON bytes, skipping jsonable_encoder
+_MOVIE_ADAPTER = TypeAdapter(MovieData)
+
+
+def _store_movie(key: Tuple[str, Optional[int]], task: asyncio.Task):
+    """Cache a finished lookup and clear it from the in-flight table"""
+    _inflight.pop(key, None)
+    if not task.cancelled() and task.exception() is None:
+        MOVIE_CACHE[key] = task.result()
+
+
+def require_tmdb_key():
+    """Fail the request if TMDB isn't configured"""
+    if not TMDB_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="TMDB API key not configured. Please add TMDB_API_KEY to .env file."
+        )
+
+
 @app.post("/search-movie")
 async def search_movie(request: MovieSearchRequest):
     """
     Search TMDB for a movie and return its details.
     Returns poster URL, rating, year, overview, and genres.
     """
-    if not TMDB_API_KEY:
-        raise HTTPException(
-            status_code=500,
-            detail="TMDB API key not configured. Please add TMDB_API_KEY to .env file."
-        )
+    require_tmdb_key()
     
+    return Response(content=await _search_one(request), media_type="application/json")
+
+
+@app.post("/search-movies")
+async def search_movies(requests: List[MovieSearchRequest]):
+    """
+    Batch variant of /search-movie: looks up all titles concurrently.
+    Returns {"results": [...]} in request order, one /search-movie payload per title.
+    """
+    require_tmdb_key()
+    
+    if len(requests) > MAX_BATCH_MOVIES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_MOVIES} movies per request")
+    
+    results = await asyncio.gather(*(_search_one(r) for r in requests), return_exceptions=True)
+    bodies = []
+    for result in results:
+        if isinstance(result, HTTPException):
+            result = orjson.dumps({"found": False, "message": result.detail})
+        elif isinstance(result, BaseException):
+            # Includes CancelledError from a shared lookup cancelled at shutdown
+            logger.error("Error fetching movie data", exc_info=result)
+            result = orjson.dumps({"found": False, "message": "Error fetching movie data"})
+        bodies.append(result)
+    return Response(content=b'{"results":[' + b",".join(bodies) + b"]}", media_type="application/json")
+
+
+async def _search_one(request: MovieSearchRequest) -> bytes:
+    """Return the cached /search-movie body for a request, fetching it if needed"""
+    key = (request.title.lower(), request.year)
+    body = MOVIE_CACHE.get(key)
+    if body is not None:
+        return body
+    
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch_movie(request))
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_store_movie, key))
+    # Shield so one client disconnecting doesn't cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+async def fetch_movie(request: MovieSearchRequest) -> bytes:
+    """Look up a movie on TMDB, bypassing the cache. Returns the JSON response body."""
     try:
-        async with httpx.AsyncClient() as http_client:
-            # Search for the movie
-            search_params = {
-                "api_key": TMDB_API_KEY,
-                "query": request.title,
-                "include_adult": False
-            }
-            if request.year:
-                search_params["year"] = request.year
-            
-            search_response = await http_client.get(
-                f"{TMDB_BASE_URL}/search/movie",
-                params=search_params
-            )
-            search_data = search_response.json()
-            
-            if not search_data.get("results"):
-                return {"found": False, "message": f"Movie '{request.title}' not found"}
-            
-            # Get the first (most relevant) result
-            movie = search_data["results"][0]
-            movie_id = movie["id"]
-            
-            # Get full movie details including genres
-            details_response = await http_client.get(
-                f"{TMDB_BASE_URL}/movie/{movie_id}",
-                params={"api_key": TMDB_API_KEY}
+        http_client = TMDB_HTTP
+
+        # Search for the movie
+        search_params = {
+            "api_key": TMDB_API_KEY,
+            "query": request.title,
+            "include_adult": False
+        }
+        if request.year:
+            search_params["year"] = request.year
+        
+        search_request = http_client.get(
+            "/search/movie",
+            params=search_params
+        )
+        
+        details_response = None
+        if not GENRE_MAP and request.movie_id:
+            # Genres will need the details endpoint; with an id hint, fetch it concurrently
+            search_response, details_response = await asyncio.gather(
+                search_request,
+                http_client.get(f"/movie/{request.movie_id}", params={"api_key": TMDB_API_KEY})
             )
+        else:
+            search_response = await search_request
+        search_response.raise_for_status()
+        search_data = search_response.json()
+        
+        if not search_data.get("results"):
+            return orjson.dumps({"found": False, "message": f"Movie '{request.title}' not found"})
+        
+        # Get the first (most relevant) result
+        movie = search_data["results"][0]
+        movie_id = movie["id"]
+        
+        # Get genre names from the cached genre table
+        if GENRE_MAP:
+            genres = [GENRE_MAP[g] for g in movie.get("genre_ids", []) if g in GENRE_MAP]
+        else:
+            # Genre table unavailable, get full movie details instead
+            if details_response is None or request.movie_id != movie_id:
+                details_response = await http_client.get(
+                    f"/movie/{movie_id}",
+                    params={"api_key": TMDB_API_KEY}
+                )
+            details_response.raise_for_status()
             details = details_response.json()
-            
-            # Build poster URL
-            poster_url = None
-            if movie.get("poster_path"):
-                poster_url = f"{TMDB_IMAGE_BASE_URL}{movie['poster_path']}"
-            
-            # Extract year from release date
-            year = ""
-            if movie.get("release_date"):
-                year = movie["release_date"][:4]
-            
-            # Get genre names
             genres = [genre["name"] for genre in details.get("genres", [])]
-            
-            return {
-                "found": True,
-                "movie": {
-                    "id": movie_id,
-                    "title": movie.get("title", request.title),
-                    "year": year,
-                    "poster_url": poster_url,
-                    "rating": round(movie.get("vote_average", 0), 1),
-                    "overview": movie.get("overview", ""),
-                    "genres": genres[:3]  # Limit to 3 genres
-                }
-            }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching movie data: {str(e)}")
+        
+        # Build poster URL
+        poster_url = None
+        if movie.get("poster_path"):
+            poster_url = f"{TMDB_IMAGE_BASE_URL}{movie['poster_path']}"
+        
+        # Extract year from release date
+        year = ""
+        if movie.get("release_date"):
+            year = movie["release_date"][:4]
+        
+        movie_data = MovieData(
+            id=movie_id,
+            title=movie.get("title", request.title),
+            year=year,
+            poster_url=poster_url,
+            rating=round(movie.get("vote_average", 0), 1),
+            overview=movie.get("overview", "")[:OVERVIEW_MAX_CHARS],
+            genres=genres[:3]  # Limit to 3 genres
+        )
+        return b'{"found":true,"movie":' + _MOVIE_ADAPTER.dump_json(movie_data) + b"}"
+    # httpx error messages include the request URL, and with it the api_key
+    # query parameter, so upstream error text is only logged, never returned
+    except httpx.HTTPStatusError as e:
+        logger.warning("TMDB returned %d for movie search", e.response.status_code)
+        if e.response.status_code == 429:
+            raise HTTPException(status_code=503, detail="TMDB rate limit reached, try again shortly")
+        raise HTTPException(status_code=502, detail="TMDB request failed")
+    except httpx.HTTPError:
+        logger.exception("Could not reach TMDB")
+        raise HTTPException(status_code=502, detail="Could not reach TMDB")
+    except Exception:
+        logger.exception("Error fetching movie data")
+        raise HTTPException(status_code=500, detail="Error fetching movie data")
 
 
 if __name__ == "__main__":
@@ -242,4 +630,20 @@ if __name__ == "__main__":
     print("🎬 Starting Cineverse API...")
     print("📍 Server running at http://localhost:8000")
     print("📚 API docs at http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Single worker by default; set WEB_CONCURRENCY to run more
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if workers > 1 and not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        # Workers inherit this before importing prometheus_client, so /metrics
+        # reports every worker rather than whichever one served the scrape
+        import tempfile
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="cineverse-metrics-")
+    # The default "auto" loop/http pick uvloop and httptools when installed
+    # (uvicorn[standard], uvloop not on Windows); an import string is required
+    # for workers > 1
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        log_level="warning"
+    )